@@ -3,11 +3,104 @@
 
 import json
 import os
+import re
+import sys
+import functools
+from contextlib import contextmanager
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, MISSING
+import numpy as np
 import yaml
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+class _ConfigDumper(_YamlDumper):
+    """Safe dumper that writes tuples as plain YAML lists"""
+    
+    def ignore_aliases(self, data):
+        # to_dict() shares list objects, which must not turn into &id anchors
+        return True
+
+_ConfigDumper.add_representer(tuple, yaml.representer.SafeRepresenter.represent_list)
+
+# slots=True needs Python 3.10+; older interpreters keep a per-instance __dict__
+_dataclass_options = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _dataclass_options['slots'] = True
+
+def _setstate(self, state):
+    """Restore a frozen config dataclass from either pickle state format
+    
+    Slotted dataclasses pickle their field values as a list, while caches
+    written before this change hold the instance __dict__.
+    """
+    if isinstance(state, dict):
+        items = state.items()
+    else:
+        items = zip((f.name for f in fields(self)), state)
+    for name, value in items:
+        object.__setattr__(self, name, value)
+    if isinstance(state, dict):
+        # Old caches lack fields added since; defaults first, then derived ones
+        for f in fields(self):
+            if f.name not in state and f.default is not MISSING:
+                object.__setattr__(self, f.name, f.default)
+        if hasattr(self, '__post_init__'):
+            self.__post_init__()
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _shallow_dict(obj) -> Dict:
+    """Field values of a config dataclass, without asdict()'s deep copy"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj) if f.init}
+
+def _positional_constructor(cls):
+    """Build `lambda d: cls(d['field'], ...)` so from_dict avoids **kwargs packing"""
+    namespace = {'cls': cls}
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            namespace[f'_default_{f.name}'] = f.default
+            args.append(f"d.get({f.name!r}, _default_{f.name})")
+        else:
+            args.append(f"d[{f.name!r}]")
+    return eval(f"lambda d: cls({', '.join(args)})", namespace)
+
+# Fast food search terms shared by every default city configuration
+_DEFAULT_FAST_FOOD = tuple(sys.intern(term) for term in (
+    'mcdonalds', 'kfc', 'taco bell', 'burger king', 'subway', 'wendys', 'popeyes'
+))
+
+@functools.lru_cache(maxsize=None)
+def _compile_search_terms(terms: Tuple[str, ...]) -> 're.Pattern':
+    """One case-insensitive alternation for a tuple of search terms"""
+    if not terms:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+# Grid point arrays shared by all CityBounds with the same extent and spacing
+_grid_cache: Dict[Tuple[float, float, float, float, float], np.ndarray] = {}
+
+@dataclass(**_dataclass_options)
 class CityBounds:
     """Geographic boundaries for a city"""
     min_lat: float
@@ -17,15 +110,58 @@ class CityBounds:
     center_lat: float
     center_lon: float
     grid_spacing: float = 0.005
+    # (min_lat, max_lat, min_lon, max_lon, center_lat, center_lon) as float64
+    _vec: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        vec = np.array([self.min_lat, self.max_lat, self.min_lon, self.max_lon,
+                        self.center_lat, self.center_lon], dtype=np.float64)
+        vec.flags.writeable = False
+        object.__setattr__(self, '_vec', vec)
+    
+    def grid_shape(self) -> Tuple[int, int]:
+        """Number of grid rows (latitudes) and columns (longitudes)"""
+        nlat = int(round((self.max_lat - self.min_lat) / self.grid_spacing))
+        nlon = int(round((self.max_lon - self.min_lon) / self.grid_spacing))
+        return nlat, nlon
     
-    def get_grid_points(self) -> List[Tuple[float, float]]:
-        """Generate grid points for the city"""
-        import numpy as np
-        lats = np.arange(self.min_lat, self.max_lat, self.grid_spacing)
-        lons = np.arange(self.min_lon, self.max_lon, self.grid_spacing)
-        return [(lat, lon) for lat in lats for lon in lons]
+    def grid_axes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Latitude and longitude values of the grid as two 1-D arrays"""
+        nlat, nlon = self.grid_shape()
+        lats = np.linspace(self.min_lat, self.max_lat, num=nlat, endpoint=False)
+        lons = np.linspace(self.min_lon, self.max_lon, num=nlon, endpoint=False)
+        return lats, lons
+    
+    def ogrid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Open grid: an (N, 1) latitude column and a (1, M) longitude row
+        
+        Distance and scoring kernels should broadcast against these instead
+        of the full (N*M, 2) point array, which keeps memory at O(N + M).
+        """
+        lats, lons = self.grid_axes()
+        return lats[:, None], lons[None, :]
+    
+    @property
+    def grid_points_array(self) -> np.ndarray:
+        """Read-only (N, 2) array of grid points, built once per extent"""
+        key = (self.min_lat, self.max_lat, self.min_lon, self.max_lon, self.grid_spacing)
+        points = _grid_cache.get(key)
+        if points is None:
+            lats, lons = self.grid_axes()
+            points = np.stack(np.meshgrid(lats, lons, indexing='ij'), -1).reshape(-1, 2)
+            points.flags.writeable = False
+            _grid_cache[key] = points
+        return points
+    
+    def get_grid_points(self) -> np.ndarray:
+        """Generate grid points for the city as an (N, 2) array of (lat, lon) rows"""
+        return self.grid_points_array
+    
+    def get_grid_points_list(self) -> List[Tuple[float, float]]:
+        """Generate grid points as a list of (lat, lon) tuples"""
+        return [tuple(point) for point in self.get_grid_points().tolist()]
 
-@dataclass
+@dataclass(**_dataclass_options)
 class CityDemographics:
     """Expected demographic ranges for normalization"""
     typical_population_range: Tuple[int, int]
@@ -33,7 +169,7 @@ class CityDemographics:
     typical_age_range: Tuple[float, float]
     population_density_factor: float = 1.0
 
-@dataclass
+@dataclass(**_dataclass_options)
 class CityMarketData:
     """Market-specific data and API configurations"""
     state_code: str
@@ -42,16 +178,30 @@ class CityMarketData:
     rental_api_city_name: str  # Specific name format for rental APIs
     major_universities: List[str]
     major_employers: List[str]
-    
-@dataclass 
+
+@dataclass(**_dataclass_options)
 class CityCompetitorData:
     """Competitor-specific search terms and market factors"""
     primary_competitor: str  # Main competitor (e.g., "chick-fil-a")
-    competitor_search_terms: List[str]
+    competitor_search_terms: Tuple[str, ...]
     market_saturation_factor: float  # Adjustment for market maturity
     fast_casual_preference_score: float  # Market preference for fast-casual (0-1)
+    _search_re: 're.Pattern' = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Loaded configs carry lists; store a tuple, sharing the default one
+        terms = tuple(self.competitor_search_terms)
+        if terms == _DEFAULT_FAST_FOOD:
+            terms = _DEFAULT_FAST_FOOD
+        object.__setattr__(self, 'competitor_search_terms', terms)
+        # One alternation scans a text once instead of once per search term
+        object.__setattr__(self, '_search_re', _compile_search_terms(terms))
+    
+    def matches(self, text: str) -> bool:
+        """Check whether text mentions any competitor search term"""
+        return self._search_re.search(text) is not None
 
-@dataclass
+@dataclass(**_dataclass_options)
 class CityConfiguration:
     """Complete city configuration"""
     city_id: str
@@ -60,55 +210,240 @@ class CityConfiguration:
     demographics: CityDemographics
     market_data: CityMarketData
     competitor_data: CityCompetitorData
+    # Source dict for nested configs that from_dict() has not built yet
+    _raw: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __getattr__(self, name):
+        # Only reached while a nested config slot is still unset
+        make = _lazy_fields.get(name)
+        if make is None or self._raw is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        try:
+            value = make(self._raw[name])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid {name} config for city {self.city_id!r}: {e}") from e
+        object.__setattr__(self, name, value)
+        return value
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization
+        
+        Nested values are shared with this configuration, not copied.
+        """
+        return {
+            'city_id': self.city_id,
+            'display_name': self.display_name,
+            'bounds': _shallow_dict(self.bounds),
+            'demographics': _shallow_dict(self.demographics),
+            'market_data': _shallow_dict(self.market_data),
+            'competitor_data': _shallow_dict(self.competitor_data)
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() output as UTF-8 JSON, e.g. for HTTP responses"""
+        return _json_dumps(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'CityConfiguration':
-        """Create from dictionary"""
-        return cls(
-            city_id=data['city_id'],
-            display_name=data['display_name'],
-            bounds=CityBounds(**data['bounds']),
-            demographics=CityDemographics(**data['demographics']),
-            market_data=CityMarketData(**data['market_data']),
-            competitor_data=CityCompetitorData(**data['competitor_data'])
-        )
+        """Create from dictionary
+        
+        The nested bounds, demographics, market and competitor configs are
+        built from `data` on first access rather than up front.
+        """
+        missing = [name for name in _lazy_fields if name not in data]
+        if missing:
+            raise KeyError(f"City config missing {', '.join(missing)}")
+        # Check required keys now so a bad section fails here, not on first access
+        for name, required in _required_keys.items():
+            section = data[name]
+            if not isinstance(section, dict):
+                raise TypeError(f"City config {data.get('city_id')!r} {name} must be a mapping")
+            absent = [key for key in required if key not in section]
+            if absent:
+                raise KeyError(f"City config {data.get('city_id')!r} {name} missing {', '.join(absent)}")
+        config = object.__new__(cls)
+        object.__setattr__(config, 'city_id', data['city_id'])
+        object.__setattr__(config, 'display_name', data['display_name'])
+        object.__setattr__(config, '_raw', data)
+        return config
+
+# Assigned after decoration: on Python 3.10 and early 3.11, slots=True
+# replaces a __setstate__ defined in the class body with its own
+for _config_cls in (CityBounds, CityDemographics, CityMarketData, CityCompetitorData, CityConfiguration):
+    _config_cls.__setstate__ = _setstate
+del _config_cls
+
+_make_bounds = _positional_constructor(CityBounds)
+_make_demographics = _positional_constructor(CityDemographics)
+_make_market_data = _positional_constructor(CityMarketData)
+_make_competitor_data = _positional_constructor(CityCompetitorData)
+
+_lazy_fields = {
+    'bounds': _make_bounds,
+    'demographics': _make_demographics,
+    'market_data': _make_market_data,
+    'competitor_data': _make_competitor_data
+}
+
+# Constructor fields without defaults, per nested config
+_required_keys = {
+    name: tuple(f.name for f in fields(cls) if f.init and f.default is MISSING)
+    for name, cls in (('bounds', CityBounds), ('demographics', CityDemographics),
+                      ('market_data', CityMarketData), ('competitor_data', CityCompetitorData))
+}
 
 class CityConfigManager:
     """Manages city configurations"""
     
+    # Last parsed configs per config file path, tagged with the file signature
+    _parsed_configs: Dict[str, Tuple[List[int], Dict[str, CityConfiguration], Optional[str]]] = {}
+    
     def __init__(self, config_file: str = "city_configs.yaml"):
         self.config_file = config_file
         self.configs: Dict[str, CityConfiguration] = {}
         self.current_city: Optional[str] = None
+        self._dirty = False
+        self._batch_depth = 0
+        self._bounds_matrix = None
         self.load_configs()
     
     def load_configs(self):
         """Load city configurations from file"""
+        self._bounds_matrix = None
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    for city_id, city_data in data['cities'].items():
-                        self.configs[city_id] = CityConfiguration.from_dict(city_data)
-                    self.current_city = data.get('current_city')
+                signature = self._config_signature()
+                cached = self._parsed_configs.get(os.path.abspath(self.config_file))
+                if cached is not None and cached[0] == signature:
+                    # Configurations are frozen, so managers can share them
+                    self.configs = dict(cached[1])
+                    self.current_city = cached[2]
+                    return
+                data = self._load_json_cache(signature)
+                if data is not None:
+                    try:
+                        self._apply_config_data(data)
+                    except Exception as e:
+                        # A bad cache must never reach the defaults below
+                        print(f"Ignoring city config cache: {e}")
+                        data = None
+                if data is None:
+                    with open(self.config_file, 'r') as f:
+                        data = yaml.load(f, Loader=_YamlLoader)
+                    self._apply_config_data(data)
+                    # Only cache YAML that produced valid configs
+                    self._save_json_cache(data, signature)
+                self._remember_configs(signature)
             except Exception as e:
                 print(f"Error loading city configs: {e}")
                 self._create_default_configs()
         else:
             self._create_default_configs()
     
+    def _apply_config_data(self, data: Dict):
+        """Build configurations from parsed config data, replacing the current ones"""
+        configs = {city_id: CityConfiguration.from_dict(city_data)
+                   for city_id, city_data in data['cities'].items()}
+        self.configs = configs
+        self.current_city = data.get('current_city')
+    
     def save_configs(self):
         """Save configurations to file"""
         data = {
             'current_city': self.current_city,
             'cities': {city_id: config.to_dict() for city_id, config in self.configs.items()}
         }
-        with open(self.config_file, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+        # Render in memory so the file gets one write instead of many small ones
+        text = yaml.dump(data, Dumper=_ConfigDumper, default_flow_style=False,
+                         indent=2, sort_keys=False)
+        tmp_file = self.config_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            f.write(text)
+        os.replace(tmp_file, self.config_file)
+        self._dirty = False
+        signature = self._config_signature()
+        self._save_json_cache(data, signature)
+        self._remember_configs(signature)
+        # The shared manager may now be stale
+        _reset_manager()
+    
+    def _remember_configs(self, signature: List[int]):
+        """Let later managers for the same unchanged file skip parsing"""
+        self._parsed_configs[os.path.abspath(self.config_file)] = (
+            signature, dict(self.configs), self.current_city
+        )
+    
+    @contextmanager
+    def batch(self):
+        """Defer saving until the outermost batch exits
+        
+        Example:
+            with manager.batch():
+                manager.add_city(config)
+                manager.set_current_city(config.city_id)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self):
+        """Save configurations if they changed since the last save"""
+        if self._dirty:
+            self.save_configs()
+    
+    def _mark_dirty(self):
+        """Record a change, saving immediately unless inside batch()"""
+        self._dirty = True
+        self._bounds_matrix = None
+        if self._batch_depth == 0:
+            self.save_configs()
+    
+    @property
+    def cache_file(self) -> str:
+        """JSON copy of the YAML config, which is much faster to parse"""
+        return self.config_file + '.cache.json'
+    
+    def _config_signature(self) -> List[int]:
+        """Modification time and size of the YAML file"""
+        st = os.stat(self.config_file)
+        return [st.st_mtime_ns, st.st_size]
+    
+    def _load_json_cache(self, signature: List[int]) -> Optional[Dict]:
+        """Load the JSON cache if it was written from the YAML file with this signature"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get('source') != signature:
+            return None
+        data = cached.get('data')
+        if not isinstance(data, dict) or not isinstance(data.get('cities'), dict):
+            return None
+        return data
+    
+    def _save_json_cache(self, data: Dict, signature: List[int]):
+        """Write the JSON cache, tagged with the YAML file it was built from
+        
+        The cache is only an accelerator: YAML that JSON can't represent
+        (non-string keys, dates) or an unwritable directory just skips it.
+        """
+        try:
+            payload = _json_dumps({'source': signature, 'data': data})
+        except (TypeError, ValueError) as e:
+            print(f"Skipping city config cache: {e}")
+            return
+        tmp_file = self.cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"Could not write city config cache: {e}")
     
     def _create_default_configs(self):
         """Create default city configurations"""
@@ -137,7 +472,7 @@ class CityConfigManager:
             ),
             competitor_data=CityCompetitorData(
                 primary_competitor="chick-fil-a",
-                competitor_search_terms=['mcdonalds', 'kfc', 'taco bell', 'burger king', 'subway', 'wendys', 'popeyes'],
+                competitor_search_terms=_DEFAULT_FAST_FOOD,
                 market_saturation_factor=0.7,  # Lower saturation, more opportunity
                 fast_casual_preference_score=0.8
             )
@@ -168,7 +503,7 @@ class CityConfigManager:
             ),
             competitor_data=CityCompetitorData(
                 primary_competitor="chick-fil-a",
-                competitor_search_terms=['mcdonalds', 'kfc', 'taco bell', 'burger king', 'subway', 'wendys', 'popeyes'],
+                competitor_search_terms=_DEFAULT_FAST_FOOD,
                 market_saturation_factor=0.9,  # Higher saturation
                 fast_casual_preference_score=0.85
             )
@@ -199,7 +534,7 @@ class CityConfigManager:
             ),
             competitor_data=CityCompetitorData(
                 primary_competitor="chick-fil-a",
-                competitor_search_terms=['mcdonalds', 'kfc', 'taco bell', 'burger king', 'subway', 'wendys', 'popeyes'],
+                competitor_search_terms=_DEFAULT_FAST_FOOD,
                 market_saturation_factor=0.8,
                 fast_casual_preference_score=0.75
             )
@@ -217,7 +552,7 @@ class CityConfigManager:
         """Set the current active city"""
         if city_id in self.configs:
             self.current_city = city_id
-            self.save_configs()
+            self._mark_dirty()
             return True
         return False
     
@@ -235,50 +570,120 @@ class CityConfigManager:
         """List available cities"""
         return list(self.configs.keys())
     
+    @property
+    def bounds_matrix(self) -> np.ndarray:
+        """(n_cities, 6) array of city bounds, rows in list_cities() order
+        
+        Columns are min_lat, max_lat, min_lon, max_lon, center_lat, center_lon.
+        """
+        if self._bounds_matrix is None:
+            rows = [config.bounds._vec for config in self.configs.values()]
+            self._bounds_matrix = np.stack(rows) if rows else np.empty((0, 6))
+        return self._bounds_matrix
+    
+    def cities_containing(self, points) -> np.ndarray:
+        """Boolean (n_points, n_cities) array: does each city's bounds contain each point"""
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        mat = self.bounds_matrix
+        lat = pts[:, None, 0]
+        lon = pts[:, None, 1]
+        return ((lat >= mat[:, 0]) & (lat <= mat[:, 1]) &
+                (lon >= mat[:, 2]) & (lon <= mat[:, 3]))
+    
+    def find_city(self, lat: float, lon: float) -> Optional[str]:
+        """ID of the first city whose bounds contain the point"""
+        hits = self.cities_containing((lat, lon))[0].nonzero()[0]
+        return self.list_cities()[hits[0]] if len(hits) else None
+    
     def add_city(self, config: CityConfiguration):
         """Add a new city configuration"""
         self.configs[config.city_id] = config
-        self.save_configs()
+        self._mark_dirty()
     
     def remove_city(self, city_id: str) -> bool:
         """Remove a city configuration"""
         if city_id in self.configs:
             del self.configs[city_id]
             if self.current_city == city_id:
-                self.current_city = next(iter(self.configs.keys()), None)
-            self.save_configs()
+                self.current_city = next(iter(self.configs), None)
+            self._mark_dirty()
             return True
         return False
 
 # === UTILITY FUNCTIONS FOR BACKWARD COMPATIBILITY ===
 
+@functools.lru_cache(maxsize=1)
+def _get_manager() -> CityConfigManager:
+    """Shared manager so the config file is parsed once per process"""
+    return CityConfigManager()
+
+def _reset_manager():
+    """Drop the shared manager so the next lookup re-reads the config file"""
+    _get_manager.cache_clear()
+    _peek_current_city_name.cache_clear()
+
 def get_city_bounds() -> Tuple[float, float, float, float]:
     """Get current city bounds for backward compatibility"""
-    manager = CityConfigManager()
-    config = manager.get_current_config()
+    config = _get_manager().get_current_config()
     if config:
         return (config.bounds.min_lat, config.bounds.max_lat, 
                 config.bounds.min_lon, config.bounds.max_lon)
     # Fallback to Grand Forks
     return (47.85, 47.95, -97.15, -97.0)
 
-def get_grid_points() -> List[Tuple[float, float]]:
+def get_grid_points() -> np.ndarray:
     """Get current city grid points for backward compatibility"""
-    manager = CityConfigManager()
-    config = manager.get_current_config()
+    config = _get_manager().get_current_config()
     if config:
         return config.bounds.get_grid_points()
     # Fallback
-    import numpy as np
     min_lat, max_lat, min_lon, max_lon = get_city_bounds()
-    lats = np.arange(min_lat, max_lat, 0.005)
-    lons = np.arange(min_lon, max_lon, 0.005)
-    return [(lat, lon) for lat in lats for lon in lons]
+    bounds = CityBounds(
+        min_lat=min_lat, max_lat=max_lat,
+        min_lon=min_lon, max_lon=max_lon,
+        center_lat=(min_lat + max_lat) / 2, center_lon=(min_lon + max_lon) / 2
+    )
+    return bounds.get_grid_points()
+
+@functools.lru_cache(maxsize=None)
+def _peek_current_city_name(config_file: str = "city_configs.yaml") -> Optional[str]:
+    """Read the current city's display name without parsing the whole config
+    
+    Scans the YAML text for `current_city:` and that city's `display_name:`
+    and only YAML-parses the single display name scalar. Returns None when
+    the file is missing or laid out differently, so callers can fall back
+    to a full load. Like the shared manager, the result is kept until
+    _reset_manager().
+    """
+    try:
+        with open(config_file, 'r') as f:
+            text = f.read()
+    except OSError:
+        return None
+    match = re.search(r'^current_city:[ \t]*(\S+)[ \t]*$', text, re.M)
+    if not match:
+        return None
+    block = re.search(rf'^  {re.escape(match.group(1))}:\n((?:    .*\n?)*)', text, re.M)
+    if not block:
+        return None
+    # A more indented next line continues a folded scalar: leave that to the full load
+    match = re.search(r'^    display_name:[ \t]*(.+)$(\n {5,}\S)?', block.group(1), re.M)
+    if not match or match.group(2):
+        return None
+    try:
+        name = yaml.load(match.group(1), Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return None
+    return name if isinstance(name, str) else None
 
 def get_current_city_name() -> str:
     """Get current city display name"""
-    manager = CityConfigManager()
-    config = manager.get_current_config()
+    # Until the shared manager exists, skip building every city just for one name
+    if _get_manager.cache_info().currsize == 0:
+        name = _peek_current_city_name()
+        if name:
+            return name
+    config = _get_manager().get_current_config()
     return config.display_name if config else "Grand Forks, ND"
 
 # === EXAMPLE USAGE ===
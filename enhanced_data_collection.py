@@ -15,6 +15,8 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from math import radians, cos, sin, asin, sqrt
 from dotenv import load_dotenv
 import pickle
+import pyarrow as pa
+import pyarrow.feather as feather
 from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 import warnings
@@ -43,7 +45,9 @@ class EnhancedCacheManager:
         
         self.cache_file = os.path.join(self.cache_dir, 'location_data_cache.pkl')
         self.usage_file = os.path.join(self.cache_dir, 'api_usage.json')
-        self.processed_data_file = os.path.join(self.cache_dir, 'processed_location_data.pkl')
+        self.processed_data_file = os.path.join(self.cache_dir, 'processed_location_data.pkl')  # legacy single pickle
+        self.processed_frame_file = os.path.join(self.cache_dir, 'processed_location_data.arrow')
+        self.processed_meta_file = os.path.join(self.cache_dir, 'processed_location_meta.pkl')
         self.model_metrics_file = os.path.join(self.cache_dir, 'model_metrics.json')
         
     def load_cache(self):
@@ -55,7 +59,7 @@ class EnhancedCacheManager:
 
     def save_cache(self, cache):
         with open(self.cache_file, 'wb') as f:
-            pickle.dump(cache, f)
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_api_usage(self):
         try:
@@ -68,6 +72,30 @@ class EnhancedCacheManager:
         with open(self.usage_file, 'w') as f:
             json.dump(usage, f)
             
+    def has_processed_data(self):
+        """Check whether processed results exist in either storage format"""
+        return ((os.path.exists(self.processed_frame_file) and os.path.exists(self.processed_meta_file))
+                or os.path.exists(self.processed_data_file))
+
+    def save_processed_data(self, processed_data):
+        """Save df_filtered as uncompressed Arrow IPC and everything else as a small pickle"""
+        meta = {key: value for key, value in processed_data.items() if key != 'df_filtered'}
+        table = pa.Table.from_pandas(processed_data['df_filtered'], preserve_index=True)
+        feather.write_feather(table, self.processed_frame_file, compression='uncompressed')
+        with open(self.processed_meta_file, 'wb') as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_processed_data(self):
+        """Load processed results, memory-mapping the Arrow frame when present"""
+        if os.path.exists(self.processed_frame_file) and os.path.exists(self.processed_meta_file):
+            with open(self.processed_meta_file, 'rb') as f:
+                data = pickle.load(f, fix_imports=False)
+            table = feather.read_table(self.processed_frame_file, memory_map=True)
+            data['df_filtered'] = table.to_pandas(split_blocks=True, self_destruct=True)
+            return data
+        with open(self.processed_data_file, 'rb') as f:
+            return pickle.load(f)
+
     def save_model_metrics(self, metrics):
         with open(self.model_metrics_file, 'w') as f:
             json.dump(metrics, f, indent=2)
@@ -750,11 +778,9 @@ def collect_and_process_all_data(city_id: str = None):
     cache_manager = EnhancedCacheManager(city_config.city_id)
     
     # Check if processed data already exists
-    if os.path.exists(cache_manager.processed_data_file):
+    if cache_manager.has_processed_data():
         print("Processed data file already exists. Loading existing data...")
-        with open(cache_manager.processed_data_file, 'rb') as f:
-            data = pickle.load(f)
-        return data
+        return cache_manager.load_processed_data()
     
     print("Starting commercial location analysis...")
     fetcher = EnhancedCommercialLocationDataFetcher(city_config)
@@ -894,10 +920,9 @@ def collect_and_process_all_data(city_id: str = None):
         'timestamp': datetime.datetime.now().isoformat()
     }
     
-    with open(cache_manager.processed_data_file, 'wb') as f:
-        pickle.dump(processed_data, f)
+    cache_manager.save_processed_data(processed_data)
     
-    print(f"Processed data saved to {cache_manager.processed_data_file}")
+    print(f"Processed data saved to {cache_manager.processed_frame_file}")
     
     return processed_data
 
@@ -1,45 +1,117 @@
 # === ENHANCED MULTI-CITY VISUALIZATION APP ===
 # Save this as: enhanced_visualization_app.py
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from dash import Dash, dcc, html, Input, Output, State, dash_table
+from dash import Dash, dcc, html, Input, Output, State, dash_table, Patch, no_update
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import pickle
+import pyarrow.feather as feather
 import os
 import json
+from collections import OrderedDict
+from functools import wraps
 from datetime import datetime
 from city_config import CityConfigManager
 
+# Columns the sidebar filters compare against
+FILTER_COLUMNS = ('predicted_revenue', 'distance_to_chickfila', 'commercial_traffic_score',
+                  'fast_food_competition', 'zoning_compliant')
+
+# Columns the browser needs to compute the sidebar stats itself
+STATS_COLUMNS = FILTER_COLUMNS + ('latitude', 'longitude', 'road_accessibility_score',
+                                  'gas_station_proximity', 'median_age', 'median_income')
+
+# Every location column the dashboard reads; Arrow loads skip the rest
+LOCATION_COLUMNS = STATS_COLUMNS + ('population',)
+
+# Above this many filtered locations the map shows only the top earners as
+# markers and summarizes the rest as a density layer
+MAP_POINT_LIMIT = 5000
+
+# Main tabs; tab '<name>-tab' renders into '<name>-content', and the
+# '<name>-view' store records the inputs that content was rendered for
+TAB_NAMES = ('map', 'analytics', 'top-locations', 'model')
+
 # === ENHANCED DATA LOADER ===
 class EnhancedDataLoader:
-    """Enhanced data loader that handles multiple cities"""
+    """Enhanced data loader that handles multiple cities
+    
+    Recently used cities stay in memory, so switching back and forth does
+    not reload them. The cache is per process: when serving with several
+    gunicorn workers, use --preload or a shared cache (Flask-Caching/Redis).
+    """
+    
+    MAX_CACHED_CITIES = 4
     
     def __init__(self):
         self.city_manager = CityConfigManager()
-        self.current_data = None
-        self.current_city_id = None
+        self._cache: OrderedDict = OrderedDict()
+        
+    @staticmethod
+    def _processed_files(city_id: str):
+        """Return the (frame, meta) Arrow files, or the legacy pickle as (pkl, None)"""
+        cache_dir = f"cache_{city_id}"
+        frame_file = os.path.join(cache_dir, 'processed_location_data.arrow')
+        meta_file = os.path.join(cache_dir, 'processed_location_meta.pkl')
+        if os.path.exists(frame_file) and os.path.exists(meta_file):
+            return frame_file, meta_file
+        legacy_file = os.path.join(cache_dir, 'processed_location_data.pkl')
+        if os.path.exists(legacy_file):
+            return legacy_file, None
+        return None, None
         
     def load_city_data(self, city_id: str):
         """Load data for a specific city"""
-        if city_id == self.current_city_id and self.current_data:
-            return self.current_data
+        if city_id in self._cache:
+            self._cache.move_to_end(city_id)
+            return self._cache[city_id]
             
-        cache_dir = f"cache_{city_id}"
-        processed_data_file = os.path.join(cache_dir, 'processed_location_data.pkl')
+        data_file, meta_file = self._processed_files(city_id)
         
-        if not os.path.exists(processed_data_file):
+        if data_file is None:
             print(f"No processed data found for {city_id}")
             return None
             
         try:
-            with open(processed_data_file, 'rb') as f:
-                data = pickle.load(f)
+            if meta_file is not None:
+                # Small scalars come from the pickle; the frame is memory-mapped Arrow
+                with open(meta_file, 'rb') as f:
+                    data = pickle.load(f, fix_imports=False)
+                # Uncompressed and mapped, so unselected columns are never paged in
+                table = feather.read_table(data_file, memory_map=True)
+                index_columns = [col for col in (table.schema.pandas_metadata or {}).get('index_columns', [])
+                                 if isinstance(col, str)]
+                table = table.select(list(LOCATION_COLUMNS) + index_columns)
+                data['df_filtered'] = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                with open(data_file, 'rb') as f:
+                    data = pickle.load(f)
+            
+            df = data['df_filtered'] = self._downcast(data['df_filtered'])
+            
+            # Contiguous arrays for the sidebar filters, cheaper to mask than Series
+            data['_filter_arrays'] = {col: df[col].to_numpy() for col in FILTER_COLUMNS}
+            data['df_display'] = self._display_frame(df)
             
-            self.current_data = data
-            self.current_city_id = city_id
+            # Competitor coordinates as arrays, passed straight to the map traces
+            chickfila_locations = data.get('chickfila_locations') or []
+            raising_canes_locations = data.get('raising_canes_locations') or []
+            data['_cf_lat'] = np.array([p[0] for p in chickfila_locations], dtype=np.float64)
+            data['_cf_lon'] = np.array([p[1] for p in chickfila_locations], dtype=np.float64)
+            data['_rc_lat'] = np.array([p[0] for p in raising_canes_locations], dtype=np.float64)
+            data['_rc_lon'] = np.array([p[1] for p in raising_canes_locations], dtype=np.float64)
+            data['_rc_names'] = np.array([p[2] for p in raising_canes_locations], dtype=object)
+            # Per-filter results for this city, evicted along with it
+            data['_memo'] = {}
+            st = os.stat(data_file)
+            data['_source'] = (st.st_mtime_ns, st.st_size)
+            
+            self._cache[city_id] = data
+            if len(self._cache) > self.MAX_CACHED_CITIES:
+                self._cache.popitem(last=False)
             print(f"Loaded data for {city_id}: {len(data['df_filtered'])} locations")
             return data
             
@@ -47,13 +119,48 @@ class EnhancedDataLoader:
             print(f"Error loading data for {city_id}: {e}")
             return None
     
+    @staticmethod
+    def _downcast(df):
+        """Narrow numeric columns to the smallest dtype that holds them exactly"""
+        dtypes = {}
+        for col in df.columns:
+            values = df[col].to_numpy()
+            if values.dtype.kind in 'iu':
+                dtypes[col] = pd.to_numeric(df[col], downcast='integer').dtype
+            elif values.dtype == np.float64 and (values.astype(np.float32) == values).all():
+                dtypes[col] = np.float32
+        if 'zoning_compliant' in df.columns and df['zoning_compliant'].isin([0, 1]).all():
+            dtypes['zoning_compliant'] = bool
+        return df.astype(dtypes)
+    
+    @staticmethod
+    def _display_frame(df):
+        """Formatted top locations table for every location, sliced per render"""
+        display_df = df[
+            ['latitude', 'longitude', 'predicted_revenue', 'commercial_traffic_score',
+             'road_accessibility_score', 'distance_to_chickfila', 'fast_food_competition',
+             'median_income', 'population', 'zoning_compliant']
+        ].round(4)
+        
+        display_df['predicted_revenue'] = display_df['predicted_revenue'].map('${:,.0f}'.format)
+        display_df['median_income'] = display_df['median_income'].map('${:,.0f}'.format)
+        display_df['population'] = display_df['population'].map('{:,.0f}'.format)
+        display_df['distance_to_chickfila'] = display_df['distance_to_chickfila'].map('{:.1f} mi'.format)
+        display_df['zoning_compliant'] = np.where(display_df['zoning_compliant'], "✅", "❌")
+        
+        display_df.columns = [
+            'Latitude', 'Longitude', 'Predicted Revenue', 'Commercial Score',
+            'Road Access', 'Distance to Competitor', 'Competition Level',
+            'Median Income', 'Population', 'Zoning OK'
+        ]
+        return display_df
+    
     def get_available_cities(self):
         """Get list of cities with available data"""
         available = []
         for city_id in self.city_manager.list_cities():
-            cache_dir = f"cache_{city_id}"
-            processed_data_file = os.path.join(cache_dir, 'processed_location_data.pkl')
-            if os.path.exists(processed_data_file):
+            processed_data_file, _ = self._processed_files(city_id)
+            if processed_data_file is not None:
                 config = self.city_manager.get_config(city_id)
                 available.append({
                     'city_id': city_id,
@@ -79,8 +186,97 @@ if not current_data:
     print("Failed to load initial city data")
     exit(1)
 
+# === FILTERING ===
+def city_cached(maxsize):
+    """LRU-cache fn(city_id, *filters) inside the city's loaded data
+    
+    Entries live in the loader's cache entry for the city, so they are
+    dropped when it evicts the city, and a reloaded city starts empty.
+    """
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(city_id, *filters):
+            memo = data_loader.load_city_data(city_id)['_memo'].setdefault(fn.__name__, OrderedDict())
+            try:
+                memo.move_to_end(filters)
+                return memo[filters]
+            except KeyError:
+                pass
+            value = memo[filters] = fn(city_id, *filters)
+            if len(memo) > maxsize:
+                memo.popitem(last=False)
+            return value
+        
+        def is_cached(city_id, *filters):
+            return filters in data_loader.load_city_data(city_id)['_memo'].get(fn.__name__, ())
+        
+        wrapper.is_cached = is_cached
+        return wrapper
+    return decorate
+
+@city_cached(maxsize=16)
+def get_filter_mask(city_id, min_revenue, max_competitor_distance,
+                    min_commercial_traffic, max_competition, zoning_filter):
+    """Boolean mask of a city's locations that pass the sidebar filters
+    
+    Cached per (city_id, filters) so revisiting filter values is free. It is
+    read-only.
+    """
+    arrays = data_loader.load_city_data(city_id)['_filter_arrays']
+    
+    # In-place numpy passes over the narrow columns measured several times
+    # faster than DataFrame.query/numexpr, which upcasts int8/int16 first
+    mask = arrays['predicted_revenue'] >= min_revenue
+    np.logical_and(mask, arrays['distance_to_chickfila'] <= max_competitor_distance, out=mask)
+    np.logical_and(mask, arrays['commercial_traffic_score'] >= min_commercial_traffic, out=mask)
+    np.logical_and(mask, arrays['fast_food_competition'] <= max_competition, out=mask)
+    
+    if zoning_filter == 'compliant':
+        np.logical_and(mask, arrays['zoning_compliant'] == 1, out=mask)
+    
+    mask.flags.writeable = False
+    return mask
+
+@city_cached(maxsize=16)
+def get_filtered(city_id, min_revenue, max_competitor_distance,
+                 min_commercial_traffic, max_competition, zoning_filter):
+    """Locations that pass the sidebar filters, cached and read-only like the mask"""
+    df = data_loader.load_city_data(city_id)['df_filtered']
+    mask = get_filter_mask(city_id, min_revenue, max_competitor_distance,
+                           min_commercial_traffic, max_competition, zoning_filter)
+    return df.iloc[np.flatnonzero(mask)]
+
+def top_k(df, col, k):
+    """The k rows with the largest col, highest first, like df.nlargest(k, col)"""
+    arr = df[col].to_numpy()
+    if len(arr) <= k:
+        idx = np.argsort(-arr, kind='stable')
+    else:
+        # O(n) selection of the k-th largest value, then sort only the top k;
+        # ties with it are taken in row order, as nlargest(keep='first') does
+        kth = np.partition(arr, -k)[-k]
+        above = np.flatnonzero(arr > kth)
+        ties = np.flatnonzero(arr == kth)[:k - len(above)]
+        part = np.sort(np.concatenate([above, ties]))
+        idx = part[np.argsort(-arr[part], kind='stable')]
+    return df.iloc[idx]
+
 # === DASH APP ===
-app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+# Full analytics rebuilds run as background jobs when dash[diskcache] is
+# installed, so they don't hold up other callbacks. The manager itself also
+# needs psutil and multiprocess, so it is built inside the try. Jobs run in
+# child processes, so the figures they build are shared through figure_store.
+try:
+    import diskcache
+    from dash import DiskcacheManager
+    background_callback_manager = DiskcacheManager(diskcache.Cache('./cache_dash_jobs'))
+    figure_store = diskcache.Cache('./cache_dash_figures', size_limit=2**28)
+except ImportError:
+    background_callback_manager = None
+    figure_store = None
+
+app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP],
+           background_callback_manager=background_callback_manager)
 
 # === APP LAYOUT ===
 app.layout = dbc.Container([
@@ -120,6 +316,7 @@ app.layout = dbc.Container([
             dbc.Card([
                 dbc.CardHeader(html.H5("🎯 Analysis Filters", className="mb-0")),
                 dbc.CardBody([
+                    # Sliders fire once on release, not on every drag step
                     html.Label("Minimum Predicted Revenue:", className="fw-bold"),
                     dcc.Slider(
                         id='revenue-slider', 
@@ -128,7 +325,8 @@ app.layout = dbc.Container([
                         step=1000, 
                         value=50000,
                         tooltip={"placement": "bottom", "always_visible": True},
-                        marks={}
+                        marks={},
+                        updatemode='mouseup'
                     ),
                     html.Br(),
                     
@@ -139,7 +337,8 @@ app.layout = dbc.Container([
                         max=15, 
                         step=1, 
                         value=8,
-                        tooltip={"placement": "bottom", "always_visible": True}
+                        tooltip={"placement": "bottom", "always_visible": True},
+                        updatemode='mouseup'
                     ),
                     html.Br(),
                     
@@ -150,7 +349,8 @@ app.layout = dbc.Container([
                         max=200,  # Will be updated dynamically
                         step=10, 
                         value=20,
-                        tooltip={"placement": "bottom", "always_visible": True}
+                        tooltip={"placement": "bottom", "always_visible": True},
+                        updatemode='mouseup'
                     ),
                     html.Br(),
                     
@@ -161,7 +361,8 @@ app.layout = dbc.Container([
                         max=15, 
                         step=1, 
                         value=8,
-                        tooltip={"placement": "bottom", "always_visible": True}
+                        tooltip={"placement": "bottom", "always_visible": True},
+                        updatemode='mouseup'
                     ),
                     html.Br(),
                     
@@ -180,7 +381,8 @@ app.layout = dbc.Container([
                     html.Div(id='model-score-display', className="text-muted mb-3"),
                     
                     html.Hr(),
-                    html.Div(id='location-stats', className="mt-3")
+                    html.Div(id='location-stats', className="mt-3"),
+                    dcc.Store(id='stats-columns')
                 ])
             ])
         ], width=3),
@@ -194,7 +396,14 @@ app.layout = dbc.Container([
                 dbc.Tab(label="🔬 Model Performance", tab_id="model-tab")
             ], id="main-tabs", active_tab="map-tab"),
             
-            html.Div(id='tab-content', style={'height': '85vh'})
+            html.Div(
+                [html.Div(id=f"{name}-content") for name in TAB_NAMES] +
+                [dcc.Store(id=f"{name}-view") for name in TAB_NAMES] +
+                [dcc.Store(id='analytics-request'), dcc.Store(id='analytics-pending'),
+                 html.Div(dbc.Spinner(color="primary"), id='analytics-spinner',
+                          className="text-center mt-5", style={'display': 'none'})],
+                id='tab-content', style={'height': '85vh'}
+            )
         ], width=9)
     ])
 ], fluid=True)
@@ -267,58 +476,175 @@ def update_city_data(city_id):
     
     return max_revenue, initial_revenue, revenue_marks, max_commercial, city_metrics, model_score
 
+# Show only the active tab's container; hidden tabs keep their content
+app.clientside_callback(
+    """
+    function(active_tab) {
+        return %s.map(name => name + '-tab' === active_tab ? {} : {display: 'none'});
+    }
+    """ % json.dumps(TAB_NAMES),
+    [Output(f"{name}-content", 'style') for name in TAB_NAMES],
+    Input('main-tabs', 'active_tab')
+)
+
+# Each tab renders only while it is active and out of date, so a slider
+# drag rebuilds one tab instead of whichever the callback happened to hit
+FILTER_INPUTS = [Input('city-dropdown', 'value'),
+                 Input('revenue-slider', 'value'),
+                 Input('competitor-distance-slider', 'value'),
+                 Input('commercial-traffic-slider', 'value'),
+                 Input('competition-slider', 'value'),
+                 Input('zoning-radio', 'value')]
+
 @app.callback(
-    Output('tab-content', 'children'),
-    [Input('main-tabs', 'active_tab'),
-     Input('city-dropdown', 'value'),
-     Input('revenue-slider', 'value'), 
-     Input('competitor-distance-slider', 'value'), 
-     Input('commercial-traffic-slider', 'value'),
-     Input('competition-slider', 'value'),
-     Input('zoning-radio', 'value')]
+    [Output('map-content', 'children'),
+     Output('map-view', 'data')],
+    [Input('main-tabs', 'active_tab')] + FILTER_INPUTS,
+    [State('map-view', 'data')]
 )
-def update_tab_content(active_tab, city_id, min_revenue, max_competitor_distance, 
-                      min_commercial_traffic, max_competition, zoning_filter):
-    """Update tab content based on active tab and filters"""
+def update_map_tab(active_tab, city_id, min_revenue, max_competitor_distance,
+                   min_commercial_traffic, max_competition, zoning_filter, map_view=None):
+    """Update the map tab for the current filters"""
+    view = [city_id, min_revenue, max_competitor_distance,
+            min_commercial_traffic, max_competition, zoning_filter]
+    if active_tab != "map-tab" or map_view == view:
+        raise PreventUpdate
     
     data = data_loader.load_city_data(city_id)
     if not data:
+        return html.Div("No data available for selected city"), None
+    
+    return create_map_tab(data, get_filtered(*view)), view
+
+def analytics_message(view):
+    """Message shown instead of the analytics figure when view has nothing to chart"""
+    if not data_loader.load_city_data(view[0]):
         return html.Div("No data available for selected city")
+    if len(get_filtered(*view)) == 0:
+        return html.Div("No data matches current filters", className="text-center mt-5")
+    return None
+
+@app.callback(
+    [Output('analytics-content', 'children'),
+     Output('analytics-view', 'data'),
+     Output('analytics-request', 'data'),
+     Output('analytics-pending', 'data')],
+    [Input('main-tabs', 'active_tab')] + FILTER_INPUTS,
+    [State('analytics-view', 'data'),
+     State('analytics-pending', 'data')]
+)
+def update_analytics_tab(active_tab, city_id, min_revenue, max_competitor_distance,
+                         min_commercial_traffic, max_competition, zoning_filter,
+                         analytics_view=None, pending_view=None):
+    """Update the analytics tab, handing full rebuilds to a background job when available"""
+    view = [city_id, min_revenue, max_competitor_distance,
+            min_commercial_traffic, max_competition, zoning_filter]
+    if active_tab != "analytics-tab" or view == (pending_view or analytics_view):
+        raise PreventUpdate
+    # A job for other inputs is still running: an answer from here would be
+    # overwritten when it lands, so re-request instead, which supersedes it
+    if pending_view:
+        return no_update, no_update, view, view
     
-    df = data['df_filtered']
+    message = analytics_message(view)
+    if message is not None:
+        return message, None, no_update, no_update
+    # The client already shows this city's figure: send the new trace
+    # arrays instead of a whole new figure
+    if analytics_view and analytics_view[0] == city_id:
+        return patch_analytics_tab(get_filtered(*view)), view, no_update, no_update
+    # Only figures nobody has built yet go to a background job
+    if background_callback_manager is None or analytics_figure_ready(*view):
+        return dcc.Graph(figure=get_analytics_figure(*view)), view, no_update, no_update
+    return no_update, no_update, view, view
+
+# Only registered as a background callback when a manager is configured;
+# the short interval keeps the client from idling a second before its first poll
+ANALYTICS_CALLBACK_OPTIONS = dict(
+    background=True,
+    interval=100,
+    running=[(Output('analytics-spinner', 'style'), {'display': 'block'}, {'display': 'none'})]
+) if background_callback_manager is not None else {}
+
+@app.callback(
+    [Output('analytics-content', 'children', allow_duplicate=True),
+     Output('analytics-view', 'data', allow_duplicate=True),
+     Output('analytics-pending', 'data', allow_duplicate=True)],
+    [Input('analytics-request', 'data')],
+    prevent_initial_call=True,
+    **ANALYTICS_CALLBACK_OPTIONS
+)
+def build_analytics_tab(view):
+    """Build the analytics tab for the requested city and filters, then clear the pending request"""
+    if not view:
+        raise PreventUpdate
+    message = analytics_message(view)
+    if message is not None:
+        return message, None, None
+    return dcc.Graph(figure=get_analytics_figure(*view)), view, None
+
+@app.callback(
+    [Output('top-locations-content', 'children'),
+     Output('top-locations-view', 'data')],
+    [Input('main-tabs', 'active_tab')] + FILTER_INPUTS,
+    [State('top-locations-view', 'data')]
+)
+def update_top_locations_tab(active_tab, city_id, min_revenue, max_competitor_distance,
+                             min_commercial_traffic, max_competition, zoning_filter, top_view=None):
+    """Update the top locations tab for the current filters"""
+    view = [city_id, min_revenue, max_competitor_distance,
+            min_commercial_traffic, max_competition, zoning_filter]
+    if active_tab != "top-locations-tab" or top_view == view:
+        raise PreventUpdate
     
-    # Apply filters
-    filtered = df[
-        (df['predicted_revenue'] >= min_revenue) &
-        (df['distance_to_chickfila'] <= max_competitor_distance) &
-        (df['commercial_traffic_score'] >= min_commercial_traffic) &
-        (df['fast_food_competition'] <= max_competition)
-    ]
+    data = data_loader.load_city_data(city_id)
+    if not data:
+        return html.Div("No data available for selected city"), None
     
-    if zoning_filter == 'compliant':
-        filtered = filtered[filtered['zoning_compliant'] == 1]
+    return create_top_locations_tab(data, get_filtered(*view)), view
+
+@app.callback(
+    [Output('model-content', 'children'),
+     Output('model-view', 'data')],
+    [Input('main-tabs', 'active_tab'),
+     Input('city-dropdown', 'value')],
+    [State('model-view', 'data')]
+)
+def update_model_tab(active_tab, city_id, model_view=None):
+    """Update the model tab for the selected city"""
+    view = [city_id]
+    if active_tab != "model-tab" or model_view == view:
+        raise PreventUpdate
     
-    if active_tab == "map-tab":
-        return create_map_tab(data, filtered)
-    elif active_tab == "analytics-tab":
-        return create_analytics_tab(data, filtered)
-    elif active_tab == "top-locations-tab":
-        return create_top_locations_tab(data, filtered)
-    elif active_tab == "model-tab":
-        return create_model_tab(data)
+    data = data_loader.load_city_data(city_id)
+    if not data:
+        return html.Div("No data available for selected city"), None
     
-    return html.Div("Select a tab")
+    return create_model_tab(data), view
 
 def create_map_tab(data, filtered):
     """Create the interactive map tab"""
+    # plotly.express is slow to import and only needed once a tab renders
+    import plotly.express as px
+    
     city_config = data.get('city_config')
-    chickfila_locations = data.get('chickfila_locations', [])
-    raising_canes_locations = data.get('raising_canes_locations', [])
+    n_locations = len(filtered)
     
     # Create base scatter plot for potential locations
-    if len(filtered) > 0:
+    if n_locations > 0:
+        city_name = city_config.display_name if city_config else 'Selected City'
+        title = f"Commercial Locations in {city_name}"
+        
+        # Keep the browser payload bounded on very large result sets
+        if n_locations > MAP_POINT_LIMIT:
+            shown = top_k(filtered, 'predicted_revenue', MAP_POINT_LIMIT)
+            rest = filtered.drop(shown.index)
+            title += f" (top {MAP_POINT_LIMIT:,} of {n_locations:,} shown as points)"
+        else:
+            shown, rest = filtered, None
+        
         fig = px.scatter_mapbox(
-            filtered, 
+            shown, 
             lat='latitude', 
             lon='longitude', 
             size='predicted_revenue', 
@@ -335,7 +661,7 @@ def create_map_tab(data, filtered):
                 'median_income': ':$,.0f',
                 'population': ':,.0f'
             },
-            title=f"Commercial Locations in {city_config.display_name if city_config else 'Selected City'}"
+            title=title
         )
         
         # Set map center
@@ -345,6 +671,23 @@ def create_map_tab(data, filtered):
                     center=dict(lat=city_config.bounds.center_lat, lon=city_config.bounds.center_lon)
                 )
             )
+        
+        # Remaining locations as a heatmap underneath the markers
+        if rest is not None:
+            fig.add_trace(
+                go.Densitymapbox(
+                    lat=rest['latitude'],
+                    lon=rest['longitude'],
+                    z=rest['predicted_revenue'],
+                    radius=10,
+                    colorscale='RdYlGn',
+                    opacity=0.4,
+                    showscale=False,
+                    hoverinfo='skip',
+                    name="Other Matching Locations"
+                )
+            )
+            fig.data = (fig.data[-1],) + fig.data[:-1]
     else:
         # Empty map if no locations match filters
         center_lat = city_config.bounds.center_lat if city_config else 47.9
@@ -361,14 +704,13 @@ def create_map_tab(data, filtered):
         )
     
     # Add competitor locations
-    if chickfila_locations and len(chickfila_locations) > 0:
-        chickfila_df = pd.DataFrame(chickfila_locations, columns=['latitude', 'longitude'])
+    if len(data['_cf_lat']) > 0:
         competitor_name = city_config.competitor_data.primary_competitor.replace('-', ' ').title() if city_config else "Primary Competitor"
         
         fig.add_trace(
             go.Scattermapbox(
-                lat=chickfila_df['latitude'],
-                lon=chickfila_df['longitude'],
+                lat=data['_cf_lat'],
+                lon=data['_cf_lon'],
                 mode='markers+text',
                 marker=dict(size=20, color='red', symbol='circle'),
                 text='🐔',
@@ -383,13 +725,11 @@ def create_map_tab(data, filtered):
         )
     
     # Add existing Raising Cane's locations
-    if raising_canes_locations and len(raising_canes_locations) > 0:
-        canes_df = pd.DataFrame(raising_canes_locations, columns=['latitude', 'longitude', 'name'])
-        
+    if len(data['_rc_lat']) > 0:
         fig.add_trace(
             go.Scattermapbox(
-                lat=canes_df['latitude'],
-                lon=canes_df['longitude'],
+                lat=data['_rc_lat'],
+                lon=data['_rc_lon'],
                 mode='markers+text',
                 marker=dict(size=20, color='purple', symbol='circle'),
                 text='🍗',
@@ -399,7 +739,7 @@ def create_map_tab(data, filtered):
                 hovertemplate="<b>Existing Raising Cane's</b><br>" +
                              "Location: %{customdata}<br>" +
                              "<extra></extra>",
-                customdata=canes_df['name']
+                customdata=data['_rc_names']
             )
         )
     
@@ -411,10 +751,57 @@ def create_map_tab(data, filtered):
     
     return dcc.Graph(figure=fig, style={'height': '80vh'})
 
-def create_analytics_tab(data, filtered):
+def analytics_trace_data(filtered):
+    """Data arrays of the analytics traces, in trace order"""
+    # Competition analysis - group by competition level
+    comp_analysis = filtered.groupby('fast_food_competition')['predicted_revenue'].agg(['mean', 'count']).reset_index()
+    comp_analysis = comp_analysis[comp_analysis['count'] >= 5]  # Only show groups with 5+ locations
+    
+    revenue = filtered['predicted_revenue'].to_numpy()
+    return [
+        {'x': revenue},
+        {'x': filtered['commercial_traffic_score'].to_numpy(), 'y': revenue},
+        {'x': comp_analysis['fast_food_competition'].to_numpy(), 'y': comp_analysis['mean'].to_numpy()},
+        {'x': filtered['median_age'].to_numpy(), 'y': filtered['median_income'].to_numpy(),
+         'marker_color': revenue},
+    ]
+
+@city_cached(maxsize=8)
+def get_analytics_figure(city_id, min_revenue, max_competitor_distance,
+                         min_commercial_traffic, max_competition, zoning_filter):
+    """Analytics figure for the filtered locations as a plain dict
+    
+    Building the subplots and validating every trace dominates the analytics
+    render, so the finished figure is cached per (city_id, filters) like the
+    filtered frame, and in figure_store when configured. Treat it as read-only.
+    """
+    filters = (min_revenue, max_competitor_distance,
+               min_commercial_traffic, max_competition, zoning_filter)
+    if figure_store is not None:
+        key = stored_figure_key(city_id, filters)
+        figure = figure_store.get(key)
+        if figure is not None:
+            return figure
+    figure = create_analytics_figure(get_filtered(city_id, *filters)).to_dict()
+    if figure_store is not None:
+        figure_store.set(key, figure)
+    return figure
+
+def stored_figure_key(city_id, filters):
+    """figure_store key, tied to the city's data file so reprocessing invalidates it"""
+    return (city_id, data_loader.load_city_data(city_id)['_source']) + tuple(filters)
+
+def analytics_figure_ready(city_id, *filters):
+    """Whether the analytics figure was already built here or by a background job"""
+    if get_analytics_figure.is_cached(city_id, *filters):
+        return True
+    return figure_store is not None and stored_figure_key(city_id, filters) in figure_store
+
+def create_analytics_figure(filtered):
     """Create analytics dashboard with multiple charts"""
-    if len(filtered) == 0:
-        return html.Div("No data matches current filters", className="text-center mt-5")
+    from plotly.subplots import make_subplots
+    
+    hist, traffic, competition, demographics = analytics_trace_data(filtered)
     
     # Create subplots
     fig = make_subplots(
@@ -427,15 +814,15 @@ def create_analytics_tab(data, filtered):
     
     # Revenue distribution histogram
     fig.add_trace(
-        go.Histogram(x=filtered['predicted_revenue'], nbinsx=20, name="Revenue Distribution"),
+        go.Histogram(x=hist['x'], nbinsx=20, name="Revenue Distribution"),
         row=1, col=1
     )
     
-    # Commercial traffic vs revenue scatter
+    # Commercial traffic vs revenue scatter (WebGL, stays fast with many points)
     fig.add_trace(
-        go.Scatter(
-            x=filtered['commercial_traffic_score'],
-            y=filtered['predicted_revenue'],
+        go.Scattergl(
+            x=traffic['x'],
+            y=traffic['y'],
             mode='markers',
             name="Traffic vs Revenue",
             hovertemplate="Traffic: %{x}<br>Revenue: $%{y:,.0f}<extra></extra>"
@@ -443,29 +830,25 @@ def create_analytics_tab(data, filtered):
         row=1, col=2
     )
     
-    # Competition analysis - group by competition level
-    comp_analysis = filtered.groupby('fast_food_competition')['predicted_revenue'].agg(['mean', 'count']).reset_index()
-    comp_analysis = comp_analysis[comp_analysis['count'] >= 5]  # Only show groups with 5+ locations
-    
     fig.add_trace(
         go.Bar(
-            x=comp_analysis['fast_food_competition'],
-            y=comp_analysis['mean'],
+            x=competition['x'],
+            y=competition['y'],
             name="Avg Revenue by Competition",
             hovertemplate="Competition Level: %{x}<br>Avg Revenue: $%{y:,.0f}<extra></extra>"
         ),
         row=2, col=1
     )
     
-    # Demographics - income vs age colored by revenue
+    # Demographics - income vs age colored by revenue (WebGL)
     fig.add_trace(
-        go.Scatter(
-            x=filtered['median_age'],
-            y=filtered['median_income'],
+        go.Scattergl(
+            x=demographics['x'],
+            y=demographics['y'],
             mode='markers',
             marker=dict(
                 size=8,
-                color=filtered['predicted_revenue'],
+                color=demographics['marker_color'],
                 colorscale='Viridis',
                 showscale=True,
                 colorbar=dict(title="Revenue")
@@ -478,34 +861,33 @@ def create_analytics_tab(data, filtered):
     
     fig.update_layout(height=600, showlegend=False, title_text="Location Analytics Dashboard")
     
-    return dcc.Graph(figure=fig)
+    return fig
+
+def patch_analytics_tab(filtered):
+    """Patch the data of an analytics figure already on the client"""
+    hist, traffic, competition, demographics = analytics_trace_data(filtered)
+    
+    patch = Patch()
+    traces = patch['props']['figure']['data']
+    traces[0]['x'] = hist['x']
+    traces[1]['x'] = traffic['x']
+    traces[1]['y'] = traffic['y']
+    traces[2]['x'] = competition['x']
+    traces[2]['y'] = competition['y']
+    traces[3]['x'] = demographics['x']
+    traces[3]['y'] = demographics['y']
+    traces[3]['marker']['color'] = demographics['marker_color']
+    return patch
 
 def create_top_locations_tab(data, filtered):
     """Create top locations analysis table"""
-    if len(filtered) == 0:
+    n_locations = len(filtered)
+    if n_locations == 0:
         return html.Div("No data matches current filters", className="text-center mt-5")
     
-    # Get top 20 locations
-    top_locations = filtered.nlargest(20, 'predicted_revenue')[
-        ['latitude', 'longitude', 'predicted_revenue', 'commercial_traffic_score',
-         'road_accessibility_score', 'distance_to_chickfila', 'fast_food_competition',
-         'median_income', 'population', 'zoning_compliant']
-    ].round(4)
-    
-    # Format for display
-    display_df = top_locations.copy()
-    display_df['predicted_revenue'] = display_df['predicted_revenue'].apply(lambda x: f"${x:,.0f}")
-    display_df['median_income'] = display_df['median_income'].apply(lambda x: f"${x:,.0f}")
-    display_df['population'] = display_df['population'].apply(lambda x: f"{x:,.0f}")
-    display_df['distance_to_chickfila'] = display_df['distance_to_chickfila'].apply(lambda x: f"{x:.1f} mi")
-    display_df['zoning_compliant'] = display_df['zoning_compliant'].apply(lambda x: "✅" if x else "❌")
-    
-    # Rename columns for display
-    display_df.columns = [
-        'Latitude', 'Longitude', 'Predicted Revenue', 'Commercial Score',
-        'Road Access', 'Distance to Competitor', 'Competition Level',
-        'Median Income', 'Population', 'Zoning OK'
-    ]
+    # Top 20 locations, already formatted at load time
+    top_index = top_k(filtered, 'predicted_revenue', 20).index
+    display_df = data['df_display'].loc[top_index]
     
     table = dash_table.DataTable(
         data=display_df.to_dict('records'),
@@ -532,12 +914,14 @@ def create_top_locations_tab(data, filtered):
     
     return html.Div([
         html.H4("🏆 Top Revenue Potential Locations", className="mb-3"),
-        html.P(f"Showing top {min(20, len(filtered))} locations sorted by predicted revenue potential"),
+        html.P(f"Showing top {min(20, n_locations)} locations sorted by predicted revenue potential"),
         table
     ])
 
 def create_model_tab(data):
     """Create model performance analysis tab"""
+    import plotly.express as px
+    
     metrics = data.get('metrics', {})
     feature_importance = data.get('feature_importance')
     
@@ -616,69 +1000,105 @@ def create_model_tab(data):
     ])
 
 @app.callback(
-    Output('location-stats', 'children'),
-    [Input('city-dropdown', 'value'),
-     Input('revenue-slider', 'value'), 
-     Input('competitor-distance-slider', 'value'), 
-     Input('commercial-traffic-slider', 'value'),
-     Input('competition-slider', 'value'),
-     Input('zoning-radio', 'value')]
+    Output('stats-columns', 'data'),
+    [Input('city-dropdown', 'value')]
 )
-def update_location_stats(city_id, min_revenue, max_competitor_distance, 
-                         min_commercial_traffic, max_competition, zoning_filter):
-    """Update location statistics sidebar"""
+def update_stats_columns(city_id):
+    """Send the city's stats columns to the browser once per city change"""
     data = data_loader.load_city_data(city_id)
     if not data:
-        return html.Div("No data available")
+        return None
     
     df = data['df_filtered']
-    chickfila_locations = data.get('chickfila_locations', [])
-    raising_canes_locations = data.get('raising_canes_locations', [])
-    
-    # Apply filters
-    filtered = df[
-        (df['predicted_revenue'] >= min_revenue) &
-        (df['distance_to_chickfila'] <= max_competitor_distance) &
-        (df['commercial_traffic_score'] >= min_commercial_traffic) &
-        (df['fast_food_competition'] <= max_competition)
-    ]
-    
-    if zoning_filter == 'compliant':
-        filtered = filtered[filtered['zoning_compliant'] == 1]
-    
-    if len(filtered) > 0:
-        best = filtered.loc[filtered['predicted_revenue'].idxmax()]
-        avg_revenue = filtered['predicted_revenue'].mean()
+    return {
+        'columns': {col: df[col].to_numpy() for col in STATS_COLUMNS},
+        'competitors': len(data.get('chickfila_locations', [])),
+        'canes': len(data.get('raising_canes_locations', []))
+    }
+
+# Location statistics sidebar, recomputed in the browser on every filter
+# change without a server round trip
+app.clientside_callback(
+    """
+    function(minRevenue, maxCompetitorDistance, minCommercialTraffic, maxCompetition,
+             zoningFilter, stats) {
+        const el = (type, children, className) => ({
+            namespace: 'dash_html_components', type: type,
+            props: className ? {children: children, className: className} : {children: children}
+        });
+        // Python's format(): exact halves round to even, thousands get commas
+        const fixed = (x, digits) => {
+            if (digits === 0 && Math.abs(x % 1) === 0.5) {
+                x = 2 * Math.round(x / 2);
+            }
+            return x.toFixed(digits);
+        };
+        const grouped = (x, digits) => {
+            const parts = fixed(x, digits).split('.');
+            parts[0] = parts[0].replace(/\B(?=(\d{3})+(?!\d))/g, ',');
+            return parts.join('.');
+        };
         
-        stats = html.Div([
-            html.H5("📊 Analysis Summary", className="text-primary"),
-            html.P(f"Filtered Locations: {len(filtered):,}"),
-            html.P(f"Average Revenue: ${avg_revenue:,.0f}"),
-            html.P(f"Competitors: {len(chickfila_locations)}"),
-            html.P(f"Existing Cane's: {len(raising_canes_locations)}"),
-            html.Hr(),
-            html.H5("🎯 Top Location", className="text-success"),
-            html.P(f"📍 {best['latitude']:.4f}, {best['longitude']:.4f}"),
-            html.P(f"💰 Revenue: ${best['predicted_revenue']:,.0f}"),
-            html.P(f"🏪 Commercial Score: {best['commercial_traffic_score']:.0f}"),
-            html.P(f"🛣️ Road Access: {best['road_accessibility_score']:.0f}"),
-            html.P(f"⛽ Gas Proximity: {best['gas_station_proximity']:.0f}"),
-            html.P(f"🎯 Competitor Distance: {best['distance_to_chickfila']:.1f} mi"),
-            html.P(f"🏢 Competition: {best['fast_food_competition']:.0f}"),
-            html.P(f"👥 Median Age: {best['median_age']:.0f}"),
-            html.P(f"💵 Median Income: ${best['median_income']:,.0f}"),
-            html.P(f"🏠 Zoning: {'✅' if best['zoning_compliant'] else '❌'}")
-        ])
-    else:
-        stats = html.Div([
-            html.H5("⚠️ No Locations Found", className="text-warning"),
-            html.P("Try adjusting your filters to see more locations."),
-            html.P(f"Total Dataset: {len(df):,} locations"),
-            html.P(f"Competitors: {len(chickfila_locations)}"),
-            html.P(f"Existing Cane's: {len(raising_canes_locations)}")
-        ])
-    
-    return stats
+        if (!stats) {
+            return el('Div', 'No data available');
+        }
+        
+        const c = stats.columns;
+        const revenue = c.predicted_revenue;
+        let count = 0, total = 0, best = -1;
+        for (let i = 0; i < revenue.length; i++) {
+            if (revenue[i] >= minRevenue &&
+                c.distance_to_chickfila[i] <= maxCompetitorDistance &&
+                c.commercial_traffic_score[i] >= minCommercialTraffic &&
+                c.fast_food_competition[i] <= maxCompetition &&
+                (zoningFilter !== 'compliant' || c.zoning_compliant[i] == 1)) {
+                count++;
+                total += revenue[i];
+                if (best < 0 || revenue[i] > revenue[best]) {
+                    best = i;
+                }
+            }
+        }
+        
+        if (count === 0) {
+            return el('Div', [
+                el('H5', '⚠️ No Locations Found', 'text-warning'),
+                el('P', 'Try adjusting your filters to see more locations.'),
+                el('P', `Total Dataset: ${grouped(revenue.length, 0)} locations`),
+                el('P', `Competitors: ${stats.competitors}`),
+                el('P', `Existing Cane's: ${stats.canes}`)
+            ]);
+        }
+        
+        return el('Div', [
+            el('H5', '📊 Analysis Summary', 'text-primary'),
+            el('P', `Filtered Locations: ${grouped(count, 0)}`),
+            el('P', `Average Revenue: $${grouped(total / count, 0)}`),
+            el('P', `Competitors: ${stats.competitors}`),
+            el('P', `Existing Cane's: ${stats.canes}`),
+            el('Hr', null),
+            el('H5', '🎯 Top Location', 'text-success'),
+            el('P', `📍 ${fixed(c.latitude[best], 4)}, ${fixed(c.longitude[best], 4)}`),
+            el('P', `💰 Revenue: $${grouped(revenue[best], 0)}`),
+            el('P', `🏪 Commercial Score: ${fixed(c.commercial_traffic_score[best], 0)}`),
+            el('P', `🛣️ Road Access: ${fixed(c.road_accessibility_score[best], 0)}`),
+            el('P', `⛽ Gas Proximity: ${fixed(c.gas_station_proximity[best], 0)}`),
+            el('P', `🎯 Competitor Distance: ${fixed(c.distance_to_chickfila[best], 1)} mi`),
+            el('P', `🏢 Competition: ${fixed(c.fast_food_competition[best], 0)}`),
+            el('P', `👥 Median Age: ${fixed(c.median_age[best], 0)}`),
+            el('P', `💵 Median Income: $${grouped(c.median_income[best], 0)}`),
+            el('P', `🏠 Zoning: ${c.zoning_compliant[best] ? '✅' : '❌'}`)
+        ]);
+    }
+    """,
+    Output('location-stats', 'children'),
+    [Input('revenue-slider', 'value'),
+     Input('competitor-distance-slider', 'value'),
+     Input('commercial-traffic-slider', 'value'),
+     Input('competition-slider', 'value'),
+     Input('zoning-radio', 'value'),
+     Input('stats-columns', 'data')]
+)
 
 if __name__ == '__main__':
     print(f"🚀 Starting Enhanced Visualization App")
@@ -92,13 +92,15 @@ def install_requirements():
         
         basic_requirements = """pandas>=1.5.0
 numpy>=1.23.0
+pyarrow>=10.0.0
 scikit-learn>=1.1.0
 requests>=2.28.0
 googlemaps>=4.7.0
 python-dotenv>=0.19.0
 plotly>=5.10.0
-dash>=2.6.0
+dash>=2.9.0
 dash-bootstrap-components>=1.2.0
+orjson>=3.8.0
 PyYAML>=6.0
 """
         with open(requirements_file, 'w') as f:
@@ -114,8 +116,8 @@ PyYAML>=6.0
 def validate_installation():
     """Validate that key packages can be imported"""
     test_imports = [
-        "pandas", "numpy", "sklearn", "requests", 
-        "googlemaps", "plotly", "dash", "yaml"
+        "pandas", "numpy", "pyarrow", "sklearn", "requests", 
+        "googlemaps", "plotly", "dash", "orjson", "yaml"
     ]
     
     failed_imports = []